@@ -0,0 +1,287 @@
+import json
+import os
+from datetime import datetime
+import numpy as np
+
+# Column layout of each table recorded for a session
+SCHEMAS = {
+    "rounds": [
+        ("round", "<i4"),
+        ("price", "<f8"),
+        ("volatility", "<f8"),
+        ("cash", "<f8"),
+        ("pnl", "<f8"),
+        ("gross_inventory", "<i8"),
+    ],
+    "chain": [
+        ("round", "<i4"),
+        ("strike", "<f8"),
+        ("call_bid", "<f8"),
+        ("call_ask", "<f8"),
+        ("put_bid", "<f8"),
+        ("put_ask", "<f8"),
+        ("call_ltp", "<f8"),
+        ("put_ltp", "<f8"),
+        ("call_iv", "<f8"),
+    ],
+    "orders": [
+        ("round", "<i4"),
+        ("strike", "<f8"),
+        ("is_call", "<i1"),
+        ("quantity", "<i4"),
+        ("price", "<f8"),
+        ("filled", "<i1"),
+        ("latency", "<f8"),
+    ],
+}
+
+# Option chain columns recorded in the chain table
+CHAIN_COLUMNS = {
+    "strike": "Strike Price",
+    "call_bid": "Call Bid Price",
+    "call_ask": "Call Ask Price",
+    "put_bid": "Put Bid Price",
+    "put_ask": "Put Ask Price",
+    "call_ltp": "Call LTP",
+    "put_ltp": "Put LTP",
+    "call_iv": "Call IV",
+}
+
+
+class SessionRecorder:
+    """
+    Streams a game session to disk as it is played.
+    Each column of each table is an append-only binary file of fixed-width values,
+    so a session can be written one round at a time and later memory-mapped
+    column by column without loading it into memory.
+    """
+
+    def __init__(self, root="sessions", session_id=None):
+        """
+        Create the session directory and open its column files.
+        Args:
+            root (str): Directory holding all recorded sessions.
+            session_id (str): Name of this session's directory. Defaults to a timestamp.
+        """
+        self.session_id = session_id or datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+        self.path = os.path.join(root, self.session_id)
+        os.makedirs(self.path)
+        with open(os.path.join(self.path, "schema.json"), "w") as schema_file:
+            json.dump(SCHEMAS, schema_file)
+
+        self.round = 0
+        self.orders_since_round = 0
+        self.files = {
+            (table, column): open(os.path.join(self.path, f"{table}.{column}.bin"), "ab")
+            for table, columns in SCHEMAS.items()
+            for column, _ in columns
+        }
+
+    def _write(self, table, columns):
+        """
+        Append values to every column of a table and flush them to disk.
+        Args:
+            table (str): Name of the table.
+            columns (dict): Column name to a scalar or array of values.
+        """
+        for column, dtype in SCHEMAS[table]:
+            file = self.files[(table, column)]
+            np.asarray(columns[column], dtype=dtype).tofile(file)
+            file.flush()
+
+    def record_round(self, market, player, pnl):
+        """
+        Record the market, option chain and player state at the end of a round.
+        Args:
+            market (Market): The market to snapshot.
+            player (Player): The player to snapshot.
+            pnl (float): The player's total P&L.
+        """
+        gross_inventory = sum(abs(position["quantity"]) for position in player.inventory.values())
+        self._write("rounds", {
+            "round": self.round,
+            "price": market.current_price,
+            "volatility": market.volatility,
+            "cash": player.cash,
+            "pnl": pnl,
+            "gross_inventory": gross_inventory,
+        })
+
+        chain = market.option_chain
+        columns = {column: chain[name].to_numpy() for column, name in CHAIN_COLUMNS.items()}
+        columns["round"] = np.full(len(chain), self.round)
+        self._write("chain", columns)
+        self.round += 1
+        self.orders_since_round = 0
+
+    def record_order(self, order, filled):
+        """
+        Record an order submitted during the current round. Round 0 is the opening
+        snapshot, so orders are tagged with the round whose end state follows them.
+        Args:
+            order (dict): The order, as built by RoundManager.submit_order.
+            filled (bool): Whether the order was filled (False if it was rejected).
+        """
+        self._write("orders", {
+            "round": self.round,
+            "strike": order["strike"],
+            "is_call": order["type"] == "call",
+            "quantity": order["quantity"],
+            "price": order["price"],
+            "filled": filled,
+            "latency": order.get("latency", np.nan),
+        })
+        self.orders_since_round += 1
+
+    def close(self):
+        """
+        Close all column files.
+        """
+        for file in self.files.values():
+            file.close()
+
+
+def load_session(path):
+    """
+    Memory-map every column of a recorded session.
+    Args:
+        path (str): The session directory.
+
+    Returns:
+        dict: Table name to a dict of column name to a read-only array.
+    """
+    with open(os.path.join(path, "schema.json")) as schema_file:
+        schemas = json.load(schema_file)
+
+    tables = {}
+    for table, columns in schemas.items():
+        tables[table] = {}
+        for column, dtype in columns:
+            column_path = os.path.join(path, f"{table}.{column}.bin")
+            if os.path.getsize(column_path) == 0:
+                tables[table][column] = np.empty(0, dtype=dtype)  # Empty files cannot be mapped
+            else:
+                tables[table][column] = np.memmap(column_path, dtype=dtype, mode="r")
+    return tables
+
+
+def sharpe_ratio(pnl):
+    """
+    Per-round Sharpe ratio: mean over standard deviation of round-to-round P&L changes.
+    Returns NaN when there are fewer than two changes or they do not vary.
+    """
+    changes = np.diff(pnl)
+    if len(changes) < 2:
+        return np.nan
+    std = changes.std(ddof=1)
+    return np.nan if np.isclose(std, 0.0) else changes.mean() / std
+
+
+def max_drawdown(pnl):
+    """
+    Largest drop in P&L from a running peak.
+    """
+    if len(pnl) == 0:
+        return 0.0
+    return float(np.max(np.maximum.accumulate(pnl) - pnl))
+
+
+def pnl_by_strike(tables):
+    """
+    Attribute P&L to strikes by marking every fill to the last recorded option chain.
+    Args:
+        tables (dict): A session, as returned by load_session.
+
+    Returns:
+        dict: Strike to P&L.
+    """
+    orders, chain = tables["orders"], tables["chain"]
+    filled = orders["filled"].astype(bool)
+    if not filled.any() or len(chain["round"]) == 0:
+        return {}
+
+    # Last traded prices per strike from the final round of the chain
+    last = chain["round"] == chain["round"][-1]
+    strikes = np.asarray(chain["strike"][last])
+    order = np.argsort(strikes)
+    strikes = strikes[order]
+    call_ltp, put_ltp = np.asarray(chain["call_ltp"][last])[order], np.asarray(chain["put_ltp"][last])[order]
+
+    trade_strikes = np.asarray(orders["strike"][filled])
+    index = np.clip(np.searchsorted(strikes, trade_strikes), 0, len(strikes) - 1)
+    marks = np.where(orders["is_call"][filled] == 1, call_ltp[index], put_ltp[index])
+    contributions = orders["quantity"][filled] * (marks - orders["price"][filled])
+
+    unique_strikes, inverse = np.unique(trade_strikes, return_inverse=True)
+    totals = np.bincount(inverse, weights=contributions)
+    return {float(strike): float(total) for strike, total in zip(unique_strikes, totals)}
+
+
+def session_report(path):
+    """
+    Compute performance metrics for one recorded session.
+    Args:
+        path (str): The session directory.
+
+    Returns:
+        dict: Sharpe, max drawdown, fill ratio, inventory turnover, fill latency
+            and P&L attribution by strike.
+    """
+    tables = load_session(path)
+    rounds, orders = tables["rounds"], tables["orders"]
+    pnl = np.asarray(rounds["pnl"])
+    filled = orders["filled"].astype(bool)
+
+    traded = np.abs(orders["quantity"][filled]).sum()
+    mean_inventory = rounds["gross_inventory"].mean() if len(pnl) else 0.0
+    latencies = orders["latency"][filled]
+
+    return {
+        "session": os.path.basename(os.path.normpath(path)),
+        "rounds": len(pnl),
+        "final_pnl": float(pnl[-1]) if len(pnl) else 0.0,
+        "sharpe": sharpe_ratio(pnl),
+        "max_drawdown": max_drawdown(pnl),
+        "orders": len(filled),
+        "fill_ratio": filled.mean() if len(filled) else np.nan,
+        "inventory_turnover": traded / mean_inventory if mean_inventory > 0 else np.nan,
+        "mean_fill_latency_ms": latencies.mean() * 1000 if len(latencies) else np.nan,
+        "pnl_by_strike": pnl_by_strike(tables),
+    }
+
+
+def iter_sessions(root="sessions"):
+    """
+    Yield the directory of every recorded session under root, in name order.
+    """
+    for entry in sorted(os.scandir(root), key=lambda entry: entry.name):
+        if entry.is_dir() and os.path.exists(os.path.join(entry.path, "schema.json")):
+            yield entry.path
+
+
+def cohort_report(root="sessions"):
+    """
+    Compute the session report for every recorded session.
+    Sessions are processed one at a time, so memory use does not grow with the cohort.
+    Args:
+        root (str): Directory holding all recorded sessions.
+
+    Returns:
+        tuple: (DataFrame of per-session metrics, Series of total P&L by strike across sessions)
+    """
+    import pandas as pd
+
+    rows = []
+    strike_totals = {}
+    for path in iter_sessions(root):
+        report = session_report(path)
+        for strike, pnl in report.pop("pnl_by_strike").items():
+            strike_totals[strike] = strike_totals.get(strike, 0.0) + pnl
+        rows.append(report)
+
+    metrics = pd.DataFrame(rows, columns=[
+        "session", "rounds", "final_pnl", "sharpe", "max_drawdown", "orders",
+        "fill_ratio", "inventory_turnover", "mean_fill_latency_ms",
+    ])
+    by_strike = pd.Series(strike_totals, name="pnl", dtype=float).sort_index()
+    return metrics, by_strike
@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class RingBuffer:
+    """
+    Fixed-capacity buffer backed by a NumPy array.
+    Once full, each new value overwrites the oldest one, so memory stays bounded.
+    """
+
+    def __init__(self, capacity, width=None, dtype=float):
+        """
+        Initialize the buffer.
+        Args:
+            capacity (int): Maximum number of entries kept.
+            width (int): Length of each entry for vector-valued buffers, or None for scalars.
+            dtype: NumPy dtype of the stored values.
+        """
+        shape = (capacity,) if width is None else (capacity, width)
+        self.data = np.zeros(shape, dtype=dtype)
+        self.capacity = capacity
+        self.start = 0  # Index of the oldest entry
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def append(self, value):
+        """
+        Add a value, overwriting the oldest entry if the buffer is full.
+        """
+        self.data[(self.start + self.size) % self.capacity] = value
+        if self.size < self.capacity:
+            self.size += 1
+        else:
+            self.start = (self.start + 1) % self.capacity
+
+    def values(self):
+        """
+        Return the stored entries in chronological order (oldest first).
+        """
+        end = self.start + self.size
+        if end <= self.capacity:
+            return self.data[self.start:end]
+        return np.concatenate((self.data[self.start:], self.data[:end - self.capacity]))
+
+    def latest(self):
+        """
+        Return the most recent entry, or None if the buffer is empty.
+        """
+        if self.size == 0:
+            return None
+        return self.data[(self.start + self.size - 1) % self.capacity]
+
+
+class MarketHistory:
+    """
+    Records per-round price, volatility, P&L and the implied volatility curve.
+    """
+
+    def __init__(self, strikes, capacity=512):
+        """
+        Initialize the history.
+        Args:
+            strikes (list): Strikes of the option chain, in chain order.
+            capacity (int): Number of rounds kept before the oldest are overwritten.
+        """
+        self.strikes = np.asarray(strikes, dtype=float)
+        self.price = RingBuffer(capacity)
+        self.volatility = RingBuffer(capacity)
+        self.pnl = RingBuffer(capacity)
+        self.iv = RingBuffer(capacity, width=len(self.strikes))
+
+    def record(self, market, pnl):
+        """
+        Record a snapshot of the market and the player's P&L.
+        Args:
+            market (Market): The market to snapshot.
+            pnl (float): The player's total P&L at this point.
+        """
+        self.price.append(market.current_price)
+        self.volatility.append(market.volatility)
+        self.pnl.append(pnl)
+        self.iv.append(market.option_chain["Call IV"].to_numpy(dtype=float))
+
+    def iv_smile(self):
+        """
+        Return the most recent implied volatility for each strike.
+        """
+        return self.iv.latest()
@@ -20,42 +20,42 @@ class Market:
         Generate a DataFrame representing the options chain for calls and puts.
         Includes random data for Open Interest (OI), Volume, Implied Volatility (IV), etc.
         """
-        data = []
-        for strike in self.strikes:
-            # Simulate data for Calls
-            call_iv = round(self.volatility * (1 + abs(strike - self.current_price) / self.current_price), 2)
-            call_ltp = max(0, self.current_price - strike) + call_iv * 5  # Example pricing logic
-            call_bid_price = round(call_ltp - np.random.uniform(0.1, 0.5), 2)
-            call_ask_price = round(call_ltp + np.random.uniform(0.1, 0.5), 2)
-            call_oi = np.random.randint(100, 10000)
-            call_volume = np.random.randint(1, 1000)
+        # Build each column for all strikes at once rather than row by row
+        strikes = np.asarray(self.strikes)
+        n = len(strikes)
+        moneyness = np.abs(strikes - self.current_price) / self.current_price
 
-            # Simulate data for Puts
-            put_iv = round(self.volatility * (1 + abs(strike - self.current_price) / self.current_price), 2)
-            put_ltp = max(0, strike - self.current_price) + put_iv * 5
-            put_bid_price = round(put_ltp - np.random.uniform(0.1, 0.5), 2)
-            put_ask_price = round(put_ltp + np.random.uniform(0.1, 0.5), 2)
-            put_oi = np.random.randint(100, 10000)
-            put_volume = np.random.randint(1, 1000)
+        # Simulate data for Calls
+        call_iv = np.round(self.volatility * (1 + moneyness), 2)
+        call_ltp = np.maximum(0, self.current_price - strikes) + call_iv * 5  # Example pricing logic
+        call_bid_price = np.round(call_ltp - np.random.uniform(0.1, 0.5, n), 2)
+        call_ask_price = np.round(call_ltp + np.random.uniform(0.1, 0.5, n), 2)
+        call_oi = np.random.randint(100, 10000, n)
+        call_volume = np.random.randint(1, 1000, n)
 
-            # Append row for the options chain
-            data.append({
-                "Strike Price": strike,
-                "Call IV": call_iv,
-                "Call LTP": round(call_ltp, 2),
-                "Call Bid Price": call_bid_price,
-                "Call Ask Price": call_ask_price,
-                "Call OI": call_oi,
-                "Call Volume": call_volume,
-                "Put IV": put_iv,
-                "Put LTP": round(put_ltp, 2),
-                "Put Bid Price": put_bid_price,
-                "Put Ask Price": put_ask_price,
-                "Put OI": put_oi,
-                "Put Volume": put_volume,
-            })
+        # Simulate data for Puts
+        put_iv = np.round(self.volatility * (1 + moneyness), 2)
+        put_ltp = np.maximum(0, strikes - self.current_price) + put_iv * 5
+        put_bid_price = np.round(put_ltp - np.random.uniform(0.1, 0.5, n), 2)
+        put_ask_price = np.round(put_ltp + np.random.uniform(0.1, 0.5, n), 2)
+        put_oi = np.random.randint(100, 10000, n)
+        put_volume = np.random.randint(1, 1000, n)
 
-        return pd.DataFrame(data)
+        return pd.DataFrame({
+            "Strike Price": strikes,
+            "Call IV": call_iv,
+            "Call LTP": np.round(call_ltp, 2),
+            "Call Bid Price": call_bid_price,
+            "Call Ask Price": call_ask_price,
+            "Call OI": call_oi,
+            "Call Volume": call_volume,
+            "Put IV": put_iv,
+            "Put LTP": np.round(put_ltp, 2),
+            "Put Bid Price": put_bid_price,
+            "Put Ask Price": put_ask_price,
+            "Put OI": put_oi,
+            "Put Volume": put_volume,
+        })
 
     def update_market(self):
         """
@@ -36,16 +36,12 @@ class Player:
             quantity = position["quantity"]
             key_dict = dict(option_key)  # Convert tuple back to dict
             strike = key_dict["strike"]
-            expiration = key_dict["expiration"]
             option_type = key_dict["type"]
             
-            # Retrieve the market price for the option
+            # Retrieve the market price for the option (the chain lists calls and puts
+            # for a single expiration side by side, so rows are matched on strike)
             try:
-                option = market.option_chain.loc[
-                    (market.option_chain["Strike Price"] == strike) &
-                    (market.option_chain["Expiration"] == expiration) &
-                    (market.option_chain["Type"] == option_type)
-                ]
+                option = market.option_chain.loc[market.option_chain["Strike Price"] == strike]
                 market_price = option["Call LTP"].values[0] if option_type == "call" else option["Put LTP"].values[0]
                 pnl += quantity * market_price
             except IndexError:
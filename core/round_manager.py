@@ -1,12 +1,34 @@
+import math
+import time
+from collections import deque
+from core.history import MarketHistory
+
+
 class RoundManager:
     """
     Manages the game rounds and interactions.
     """
-    def __init__(self, market, player, rounds=5):
+    def __init__(self, market, player, rounds=5, recorder=None):
+        """
+        Initialize the RoundManager.
+        Args:
+            market (Market): The market being traded.
+            player (Player): The player.
+            rounds (int): Number of rounds in the text-mode game.
+            recorder (SessionRecorder): Optional recorder streaming the session to disk.
+        """
         self.market = market
         self.player = player
         self.rounds = rounds
         self.current_round = 0
+        self.recorder = recorder
+        self.history = MarketHistory(market.strikes)
+        total_pnl = player.get_total_pnl(market)
+        self.history.record(market, total_pnl)
+        if self.recorder:
+            self.recorder.record_round(market, player, total_pnl)
+        self.order_queue = deque()  # Validated orders waiting to be filled
+        self.trades = []  # Filled orders, in fill order
 
     def start_round(self):
         """
@@ -26,9 +48,83 @@ class RoundManager:
         print("\nOption Chain:")
         print(self.market.option_chain.to_string(index=False))
 
+    def submit_order(self, strike, option_type, quantity, price, submitted_at=None):
+        """
+        Validates an order and queues it to be filled by process_player_input.
+        Args:
+            strike (int): Strike price of the option.
+            option_type (str): 'call' or 'put'.
+            quantity (int): Number of options (positive to buy, negative to sell).
+            price (float): Price per option.
+            submitted_at (float): time.perf_counter() value when the order was entered,
+                used to measure keystroke-to-fill latency. Defaults to now.
+
+        Returns:
+            dict: The queued order.
+
+        Raises:
+            ValueError: If any field of the order is invalid.
+        """
+        option_type = str(option_type).lower()
+        order = {
+            "strike": strike,
+            "type": option_type,
+            "quantity": quantity,
+            "price": price,
+            "submitted_at": time.perf_counter() if submitted_at is None else submitted_at,
+        }
+
+        error = None
+        if strike not in self.market.strikes:
+            error = f"Unknown strike: {strike}"
+        elif option_type not in ("call", "put"):
+            error = f"Option type must be 'call' or 'put', got {option_type!r}"
+        elif int(quantity) != quantity or quantity == 0:
+            error = "Quantity must be a non-zero whole number"
+        elif not math.isfinite(price) or price <= 0:
+            error = "Price must be positive"
+
+        if error:
+            if self.recorder:
+                self.recorder.record_order(order, filled=False)
+            raise ValueError(error)
+
+        order["quantity"] = int(quantity)
+        order["price"] = round(float(price), 2)
+        self.order_queue.append(order)
+        return order
+
     def process_player_input(self):
         """
-        Collects and processes player input for bid/ask quotes or trades.
+        Fills every queued order without blocking.
+
+        Returns:
+            list: The orders filled by this call, each with its fill latency in seconds.
+        """
+        fills = []
+        while self.order_queue:
+            order = self.order_queue.popleft()
+
+            # Update the player's inventory and cash
+            option_key = {"strike": order["strike"], "type": order["type"], "expiration": "2024-12-31"}
+            self.player.update_inventory(option_key, order["quantity"], order["price"])
+
+            order["latency"] = time.perf_counter() - order["submitted_at"]
+            fills.append(order)
+            if self.recorder:
+                self.recorder.record_order(order, filled=True)
+            print(f"Trade executed: {order['quantity']} {order['type'].upper()} options at ${order['price']:.2f}")
+
+        if fills:
+            self.player.total_pnl = self.player.get_total_pnl(self.market)
+            print(f"Updated Cash: ${self.player.cash:.2f}")
+        self.trades.extend(fills)
+        return fills
+
+    def prompt_terminal_order(self):
+        """
+        Collects a single order from the terminal (blocking) and queues it.
+        Only used by the text-mode game in play_game.
         """
         while True:
             try:
@@ -36,16 +132,9 @@ class RoundManager:
                 option_type = input("Enter option type ('call' or 'put'): ").lower()
                 quantity = int(input("Enter quantity (positive to buy, negative to sell): "))
                 price = float(input("Enter your price: "))
-
-                # Update the player's inventory and cash
-                option_key = {"strike": strike, "type": option_type, "expiration": "2024-12-31"}
-                self.player.update_inventory(option_key, quantity, price)
-
-                print(f"Trade executed: {quantity} {option_type.upper()} options at ${price:.2f}")
-                print(f"Updated Cash: ${self.player.cash:.2f}")
-                break
-            except (ValueError, KeyError):
-                print("Invalid input. Please try again.")
+                return self.submit_order(strike, option_type, quantity, price)
+            except ValueError as error:
+                print(f"Invalid input: {error}. Please try again.")
 
     def simulate_round(self):
         """
@@ -56,6 +145,10 @@ class RoundManager:
 
         # Calculate player's total P&L
         total_pnl = self.player.get_total_pnl(self.market)
+        self.player.total_pnl = total_pnl
+        self.history.record(self.market, total_pnl)
+        if self.recorder:
+            self.recorder.record_round(self.market, self.player, total_pnl)
 
         print("\n--- Round Results ---")
         print(f"Updated Stock Price: {self.market.current_price:.2f}")
@@ -63,6 +156,16 @@ class RoundManager:
         print(self.market.option_chain.to_string(index=False))
         print(f"Total P&L: ${total_pnl:.2f}")
 
+    def end_session(self):
+        """
+        Records the final state if orders were filled since the last round, then closes the recorder.
+        """
+        if not self.recorder:
+            return
+        if self.recorder.orders_since_round:
+            self.recorder.record_round(self.market, self.player, self.player.get_total_pnl(self.market))
+        self.recorder.close()
+
     def play_game(self):
         """
         Runs the game for the specified number of rounds.
@@ -70,9 +173,11 @@ class RoundManager:
         print("\n--- Welcome to the Market Making Game ---")
         for _ in range(self.rounds):
             self.start_round()
+            self.prompt_terminal_order()
             self.process_player_input()
             self.simulate_round()
 
         print("\n--- Game Over ---")
+        self.end_session()
         final_pnl = self.player.get_total_pnl(self.market)
         print(f"Final Total P&L: ${final_pnl:.2f}")
@@ -1,36 +1,45 @@
 import pygame
-from core.market import Market
-from core.player import Player
-from core.round_manager import RoundManager
+from scenes.scene_manager import SceneManager
 from scenes.main_menu import MainMenuScene
-from scenes.gameplay import GameplayScene
-from scenes.results import ResultsScene
 
-class SceneManager:
+
+def game_flow(screen, clock):
     """
-    Manages transitions between different scenes in the game.
+    Yields the root scene for each stage of the game, in order, forever.
+    The SceneManager asks for the next scene whenever the current one stops.
     """
-    def __init__(self, screen, clock):
-        self.screen = screen
-        self.clock = clock
-        self.current_scene = None
+    # The menu is reused on every restart instead of being rebuilt
+    main_menu = MainMenuScene(screen, clock)
+
+    while True:
+        # Show the main menu scene
+        yield main_menu
+
+        # Heavy modules (pandas, NumPy, the market engine) are imported only once
+        # the player starts a game, so the menu appears without waiting for them
+        from core.market import Market
+        from core.player import Player
+        from core.round_manager import RoundManager
+        from core.analytics import SessionRecorder, session_report
+        from scenes.gameplay import GameplayScene
+        from scenes.results import ResultsScene
+
+        # Initialize the core game components
+        market = Market(
+            initial_price=100.0,
+            volatility=0.30,
+            strikes=[80, 85, 90, 95, 100, 105, 110, 115, 120]
+        )
+        player = Player()
+        recorder = SessionRecorder()  # Streams the session to sessions/<timestamp>/
+        round_manager = RoundManager(market, player, rounds=5, recorder=recorder)
 
-    def run_scene(self, scene):
-        """
-        Runs the given scene and manages transitions.
-        Args:
-            scene (BaseScene): The scene to run.
-        """
-        self.current_scene = scene
-        self.current_scene.run()
+        # Show the gameplay scene
+        yield GameplayScene(screen, clock, market, player, round_manager)
 
-    def transition_to(self, scene):
-        """
-        Transitions to a new scene.
-        Args:
-            scene (BaseScene): The next scene to run.
-        """
-        self.run_scene(scene)
+        # Finish recording and show the results scene with the session's report
+        round_manager.end_session()
+        yield ResultsScene(screen, clock, player, session_report(recorder.path))
 
 
 def main():
@@ -40,31 +49,11 @@ def main():
     clock = pygame.time.Clock()
     pygame.display.set_caption("Market Making Game")
 
-    # Initialize the SceneManager
+    # The SceneManager owns the single main loop
     scene_manager = SceneManager(screen, clock)
+    scene_manager.run(game_flow(screen, clock))
 
-    # Main game loop
-    while True:
-        # Run the main menu scene
-        main_menu = MainMenuScene(screen, clock)
-        scene_manager.run_scene(main_menu)
-
-        # Initialize the core game components
-        market = Market(
-            initial_price=100.0,
-            volatility=0.30,
-            strikes=[80, 85, 90, 95, 100, 105, 110, 115, 120]
-        )
-        player = Player()
-        round_manager = RoundManager(market, player, rounds=5)
-
-        # Run the gameplay scene
-        gameplay = GameplayScene(screen, clock, market, player, round_manager)
-        scene_manager.run_scene(gameplay)
-
-        # Run the results scene
-        results = ResultsScene(screen, clock, player)
-        scene_manager.run_scene(results)
+    pygame.quit()
 
 
 if __name__ == "__main__":
@@ -1,4 +1,3 @@
-import pygame
 from abc import ABC, abstractmethod
 
 
@@ -6,8 +5,12 @@ class BaseScene(ABC):
     """
     Abstract base class for all scenes in the game.
     Defines the structure for handling events, updating state, and drawing visuals.
+    Scenes are driven by the SceneManager's main loop rather than running their own.
     """
 
+    # Overlay scenes are drawn on top of the scene beneath them instead of replacing it
+    overlay = False
+
     def __init__(self, screen, clock):
         """
         Initialize the scene.
@@ -17,7 +20,9 @@ class BaseScene(ABC):
         """
         self.screen = screen
         self.clock = clock
+        self.manager = None  # Set by the SceneManager when the scene is pushed
         self.running = True
+        self.dirty = True  # Whether the scene needs to be redrawn
 
     @abstractmethod
     def handle_events(self, events):
@@ -42,32 +47,37 @@ class BaseScene(ABC):
         """
         pass
 
-    def run(self):
-        """
-        Main loop for the scene. Handles events, updates state, and draws visuals.
-        """
-        while self.running:
-            # Handle events
-            events = pygame.event.get()
-            for event in events:
-                if event.type == pygame.QUIT:
-                    self.running = False
-                    pygame.quit()
-                    exit()
-            self.handle_events(events)
-
-            # Update state
-            self.update()
+    def on_enter(self):
+        """
+        Called when the scene is pushed onto the stack. Scenes may be entered
+        again after stopping (e.g., the main menu on restart).
+        """
+        self.running = True
+        self.dirty = True
 
-            # Draw visuals
-            self.draw()
+    def is_animating(self):
+        """
+        Return True while the scene needs redrawing every frame even without input.
+        Static scenes return False so the main loop can idle until the next event.
+        """
+        return False
 
-            # Refresh the display and control the frame rate
-            pygame.display.flip()
-            self.clock.tick(60)
+    def mark_dirty(self):
+        """
+        Request a redraw on the next frame.
+        """
+        self.dirty = True
 
     def stop(self):
         """
         Stop the scene and transition to another.
         """
         self.running = False
+
+    def quit_game(self):
+        """
+        Ask the SceneManager to end the main loop and exit the game.
+        """
+        self.running = False
+        if self.manager:
+            self.manager.quit()
@@ -0,0 +1,90 @@
+import pygame
+import numpy as np
+
+
+class LineChart:
+    """
+    Line chart drawn onto a cached surface.
+    The surface is only rebuilt when new data arrives; each frame just blits it.
+    """
+
+    def __init__(self, rect, font, title, line_color=(0, 200, 255)):
+        """
+        Initialize the chart.
+        Args:
+            rect (pygame.Rect): Area of the screen the chart occupies.
+            font (pygame.font.Font): Font used for the title and axis labels.
+            title (str): Title shown in the top-left corner.
+            line_color (tuple): RGB color of the plotted line.
+        """
+        self.rect = pygame.Rect(rect)
+        self.font = font
+        self.title = title
+        self.line_color = line_color
+        self.background_color = (20, 20, 20)  # Near-black panel
+        self.text_color = (200, 200, 200)  # Light gray labels
+        self.surface = pygame.Surface(self.rect.size)
+        self.set_data(np.empty(0))
+
+    def set_data(self, y, x=None):
+        """
+        Rebuild the chart surface from the given series.
+        Args:
+            y (np.ndarray): Values to plot.
+            x (np.ndarray): Matching x coordinates, or None to space points evenly.
+        """
+        self.surface.fill(self.background_color)
+        label = self.title if len(y) == 0 or x is not None else f"{self.title}: {y[-1]:.2f}"
+        self.surface.blit(self.font.render(label, True, self.text_color), (4, 2))
+
+        if len(y) >= 2:
+            points = self.to_points(np.asarray(y, dtype=float), x)
+            pygame.draw.lines(self.surface, self.line_color, False, points, 2)
+
+    def to_points(self, y, x=None):
+        """
+        Scale a series into pixel coordinates inside the chart area (below the title).
+        Returns:
+            np.ndarray: An (n, 2) array of points.
+        """
+        top = self.font.get_linesize() + 4
+        width, height = self.rect.width - 1, self.rect.height - top - 1
+        x = np.arange(len(y), dtype=float) if x is None else np.asarray(x, dtype=float)
+
+        x_span = np.ptp(x) or 1.0
+        y_span = np.ptp(y)
+        px = (x - x.min()) / x_span * width
+        if y_span:
+            py = top + height - (y - y.min()) / y_span * height
+        else:
+            py = np.full(len(y), top + height / 2)  # Flat series sits mid-chart
+        return np.column_stack((px, py))
+
+    def draw(self, surface):
+        """
+        Blit the cached chart onto the given surface.
+        """
+        surface.blit(self.surface, self.rect)
+
+
+class SmileChart(LineChart):
+    """
+    Implied volatility smile: IV plotted against strike, with a marker at the underlying price.
+    """
+
+    def set_smile(self, strikes, iv, underlying_price):
+        """
+        Rebuild the chart for the current IV curve.
+        Args:
+            strikes (np.ndarray): Strike prices.
+            iv (np.ndarray): Implied volatility for each strike.
+            underlying_price (float): Current price of the underlying.
+        """
+        order = np.argsort(strikes)
+        strikes, iv = strikes[order], iv[order]
+        self.set_data(iv, strikes)
+
+        if len(strikes) >= 2 and strikes[0] <= underlying_price <= strikes[-1]:
+            marker_x = (underlying_price - strikes[0]) / np.ptp(strikes) * (self.rect.width - 1)
+            top = self.font.get_linesize() + 4
+            pygame.draw.line(self.surface, self.text_color, (marker_x, top), (marker_x, self.rect.height), 1)
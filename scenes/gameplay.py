@@ -1,5 +1,9 @@
 import pygame
 from scenes.base_scene import BaseScene
+from scenes.option_table import OptionChainTable
+from scenes.charts import LineChart, SmileChart
+from scenes.trade_ticket import TradeTicketScene
+from utils.resources import resources
 
 class GameplayScene(BaseScene):
     """
@@ -12,13 +16,23 @@ class GameplayScene(BaseScene):
         self.market = market
         self.player = player
         self.round_manager = round_manager
-        self.font = pygame.font.Font(None, 28)
-        self.header_font = pygame.font.Font(None, 36)
+        self.font = resources.font(28)
+        self.header_font = resources.font(36)
         self.background_color = (0, 0, 0)  # Black background
         self.text_color = (255, 255, 255)  # White text
 
+        # Option chain table (header plus 10 visible rows)
+        self.option_table = OptionChainTable(pygame.Rect(20, 120, 460, 330), self.font)
+        self.option_table.set_data(self.market.option_chain)
+
+        # History charts in the right-hand column
+        self.price_chart = LineChart(pygame.Rect(500, 80, 280, 120), self.font, "Price")
+        self.pnl_chart = LineChart(pygame.Rect(500, 210, 280, 120), self.font, "P&L", line_color=(0, 220, 120))
+        self.smile_chart = SmileChart(pygame.Rect(500, 340, 280, 110), self.font, "IV Smile", line_color=(255, 180, 0))
+        self.refresh_charts()
+
         # State variables
-        self.current_message = "Press S to simulate the round, Q to quit."
+        self.current_message = "Press S to simulate the round, T to trade, Q to quit."
 
     def handle_events(self, events):
         """
@@ -28,16 +42,53 @@ class GameplayScene(BaseScene):
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_s:  # Simulate the round
                     self.round_manager.simulate_round()
-                    self.current_message = "Round simulated! Press S again or Q to quit."
+                    self.option_table.set_data(self.market.option_chain)
+                    self.refresh_charts()
+                    self.current_message = "Round simulated! Press S again, T to trade or Q to quit."
+                elif event.key == pygame.K_t:  # Open the trade ticket on the selected strike
+                    self.open_trade_ticket()
                 elif event.key == pygame.K_q:  # Quit the game
                     self.stop()
+            self.option_table.handle_event(event)
+
+    def open_trade_ticket(self):
+        """
+        Show the trade ticket over the gameplay screen, prefilled with the selected strike.
+        """
+        row = self.option_table.selected_row_index()
+        if row is None:
+            return
+        strike = int(self.market.option_chain["Strike Price"].iloc[row])
+        self.manager.push(TradeTicketScene(self.screen, self.clock, self.market, self.round_manager, strike))
+
+    def refresh_charts(self):
+        """
+        Rebuild the history charts from the round manager's recorded history.
+        """
+        history = self.round_manager.history
+        self.price_chart.set_data(history.price.values())
+        self.pnl_chart.set_data(history.pnl.values())
+        self.smile_chart.set_smile(history.strikes, history.iv_smile(), self.market.current_price)
+
+    def is_animating(self):
+        """
+        Keep redrawing while changed rows in the option chain are highlighted.
+        """
+        return self.option_table.is_animating()
 
     def update(self):
         """
         Update game logic (e.g., market state, player P&L).
+        Fills any orders queued from the trade ticket.
         """
-        # You can include any periodic updates here if needed
-        pass
+        fills = self.round_manager.process_player_input()
+        if fills:
+            last = fills[-1]
+            self.current_message = (
+                f"Filled {last['quantity']} {last['type'].upper()} {last['strike']} @ ${last['price']:.2f} "
+                f"in {last['latency'] * 1000:.2f} ms"
+            )
+            self.mark_dirty()
 
     def draw(self):
         """
@@ -52,20 +103,14 @@ class GameplayScene(BaseScene):
         self.screen.blit(stock_price_text, (20, 20))
 
         # Draw the option chain
-        options_title = self.header_font.render("Options Chain", True, self.text_color)
+        options_title = resources.text("Options Chain", 36, self.text_color)
         self.screen.blit(options_title, (20, 80))
 
-        y_offset = 120
-        for _, row in self.market.option_chain.iterrows():
-            option_text = self.font.render(
-                f"Strike: {row['Strike Price']} | "
-                f"Call Bid: {row['Call Bid Price']} | Call Ask: {row['Call Ask Price']} | "
-                f"Put Bid: {row['Put Bid Price']} | Put Ask: {row['Put Ask Price']}",
-                True,
-                self.text_color,
-            )
-            self.screen.blit(option_text, (20, y_offset))
-            y_offset += 30
+        self.option_table.draw(self.screen)
+        self.price_chart.draw(self.screen)
+        self.pnl_chart.draw(self.screen)
+        self.smile_chart.draw(self.screen)
+        y_offset = self.option_table.rect.bottom
 
         # Draw player stats
         player_cash_text = self.font.render(f"Cash: ${self.player.cash:.2f}", True, self.text_color)
@@ -1,5 +1,6 @@
 import pygame
 from scenes.base_scene import BaseScene
+from utils.resources import resources
 
 class MainMenuScene(BaseScene):
     """
@@ -9,8 +10,8 @@ class MainMenuScene(BaseScene):
 
     def __init__(self, screen, clock):
         super().__init__(screen, clock)
-        self.font_title = pygame.font.Font(None, 64)
-        self.font_instruction = pygame.font.Font(None, 36)
+        self.font_title = resources.font(64)
+        self.font_instruction = resources.font(36)
         self.title_color = (255, 255, 255)  # White
         self.instruction_color = (200, 200, 200)  # Light gray
         self.background_color = (0, 0, 0)  # Black
@@ -24,9 +25,7 @@ class MainMenuScene(BaseScene):
                 if event.key == pygame.K_RETURN:  # Start the game
                     self.stop()  # This stops the scene and transitions to the next one
                 elif event.key == pygame.K_ESCAPE:  # Quit the game
-                    self.running = False
-                    pygame.quit()
-                    exit()
+                    self.quit_game()
 
     def update(self):
         """
@@ -39,7 +38,16 @@ class MainMenuScene(BaseScene):
         """
         Draw the main menu screen.
         """
-        self.screen.fill(self.background_color)  # Clear the screen with a black background
+        # The menu is fully static, so it is rendered once and reused
+        menu_surface = resources.surface("main_menu", self.render_menu)
+        self.screen.blit(menu_surface, (0, 0))
+
+    def render_menu(self):
+        """
+        Render the static main menu onto a screen-sized surface.
+        """
+        surface = pygame.Surface(self.screen.get_size())
+        surface.fill(self.background_color)  # Clear the screen with a black background
 
         # Render the title and instructions
         title_text = self.font_title.render("Market Making Game", True, self.title_color)
@@ -47,11 +55,12 @@ class MainMenuScene(BaseScene):
         quit_text = self.font_instruction.render("Press ESC to Quit", True, self.instruction_color)
 
         # Center the title and instructions on the screen
-        title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 200))
-        instruction_rect = instruction_text.get_rect(center=(self.screen.get_width() // 2, 300))
-        quit_rect = quit_text.get_rect(center=(self.screen.get_width() // 2, 350))
+        title_rect = title_text.get_rect(center=(surface.get_width() // 2, 200))
+        instruction_rect = instruction_text.get_rect(center=(surface.get_width() // 2, 300))
+        quit_rect = quit_text.get_rect(center=(surface.get_width() // 2, 350))
 
         # Draw the text
-        self.screen.blit(title_text, title_rect)
-        self.screen.blit(instruction_text, instruction_rect)
-        self.screen.blit(quit_text, quit_rect)
+        surface.blit(title_text, title_rect)
+        surface.blit(instruction_text, instruction_rect)
+        surface.blit(quit_text, quit_rect)
+        return surface
@@ -0,0 +1,238 @@
+import pygame
+import numpy as np
+
+
+class OptionChainTable:
+    """
+    Scrollable, virtualized table for displaying the options chain.
+    Only the rows inside the visible window are rendered, so drawing cost
+    does not depend on the number of strikes in the chain.
+    """
+
+    COLUMNS = [
+        ("Strike", "Strike Price"),
+        ("Call Bid", "Call Bid Price"),
+        ("Call Ask", "Call Ask Price"),
+        ("Put Bid", "Put Bid Price"),
+        ("Put Ask", "Put Ask Price"),
+    ]
+
+    def __init__(self, rect, font, row_height=30, highlight_ms=1500):
+        """
+        Initialize the table.
+        Args:
+            rect (pygame.Rect): Area of the screen the table occupies (header included).
+            font (pygame.font.Font): Font used for the header and rows.
+            row_height (int): Height of a single row in pixels.
+            highlight_ms (int): How long rows stay highlighted after their values change.
+        """
+        self.rect = pygame.Rect(rect)
+        self.font = font
+        self.row_height = row_height
+        self.highlight_ms = highlight_ms
+        self.visible_rows = max(1, (self.rect.height - row_height) // row_height)
+        self.column_width = self.rect.width // len(self.COLUMNS)
+
+        self.text_color = (255, 255, 255)  # White text
+        self.header_color = (200, 200, 200)  # Light gray header
+        self.selected_color = (40, 40, 90)  # Dark blue selection
+        self.highlight_color = (90, 70, 0)  # Amber highlight for changed rows
+
+        # Table state
+        self.values = np.empty((0, len(self.COLUMNS)))
+        self.order = np.empty(0, dtype=np.intp)
+        self.changed_at = np.empty(0, dtype=np.int64)
+        self.highlight_until = 0
+        self.sort_column = 0
+        self.sort_descending = False
+        self.scroll = 0  # Position (in sorted order) of the first visible row
+        self.selected = 0  # Position (in sorted order) of the selected row
+
+        # Rendered text surfaces for the visible rows, keyed by data row index
+        self._row_cache = {}
+        self._header_surfaces = [self.font.render(label, True, self.header_color) for label, _ in self.COLUMNS]
+        self._arrow_surfaces = {False: self.font.render("^", True, self.header_color),
+                                True: self.font.render("v", True, self.header_color)}
+
+    def set_data(self, option_chain):
+        """
+        Load the option chain into the table, highlighting rows whose values changed.
+        Args:
+            option_chain (pd.DataFrame): The option chain to display.
+        """
+        values = option_chain[[column for _, column in self.COLUMNS]].to_numpy(dtype=float)
+        now = pygame.time.get_ticks()
+
+        if values.shape == self.values.shape:
+            changed = np.any(values != self.values, axis=1)
+            self.changed_at[changed] = now
+            if changed.any():
+                self.highlight_until = now + self.highlight_ms
+        else:
+            self.changed_at = np.full(len(values), -self.highlight_ms, dtype=np.int64)
+
+        self.values = values
+        self._row_cache.clear()
+        self._sort()
+        self._clamp()
+
+    def sort_by(self, column):
+        """
+        Sort the table by the given column index, toggling direction if it is already the sort column.
+        Args:
+            column (int): Index into COLUMNS.
+        """
+        selected_row = self.selected_row_index()
+        if column == self.sort_column:
+            self.sort_descending = not self.sort_descending
+        else:
+            self.sort_column = column
+            self.sort_descending = False
+        self._sort()
+
+        # Keep the same data row selected after re-sorting
+        if selected_row is not None:
+            self.selected = int(np.flatnonzero(self.order == selected_row)[0])
+            self._scroll_to_selected()
+
+    def scroll_by(self, rows):
+        """
+        Scroll the visible window by the given number of rows.
+        """
+        self.scroll += rows
+        self._clamp()
+
+    def select_by(self, rows):
+        """
+        Move the selection by the given number of rows, scrolling to keep it visible.
+        """
+        self.selected += rows
+        self._clamp()
+        self._scroll_to_selected()
+
+    def selected_row_index(self):
+        """
+        Return the index of the selected row in the option chain, or None if the table is empty.
+        """
+        if len(self.order) == 0:
+            return None
+        return int(self.order[self.selected])
+
+    def visible_range(self):
+        """
+        Return the (start, stop) positions, in sorted order, of the rows currently on screen.
+        """
+        return self.scroll, min(self.scroll + self.visible_rows, len(self.order))
+
+    def is_animating(self):
+        """
+        Return True while any changed-row highlight is still on screen.
+        """
+        return pygame.time.get_ticks() < self.highlight_until
+
+    def handle_event(self, event):
+        """
+        Handle scrolling, selection and sorting input.
+        Args:
+            event (pygame.event.Event): The event to handle.
+        """
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_by(-event.y)
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_UP:
+                self.select_by(-1)
+            elif event.key == pygame.K_DOWN:
+                self.select_by(1)
+            elif event.key == pygame.K_PAGEUP:
+                self.select_by(-self.visible_rows)
+            elif event.key == pygame.K_PAGEDOWN:
+                self.select_by(self.visible_rows)
+        elif event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and self.rect.collidepoint(event.pos):
+            column = min((event.pos[0] - self.rect.x) // self.column_width, len(self.COLUMNS) - 1)
+            row = (event.pos[1] - self.rect.y) // self.row_height
+            if row == 0:  # Header click sorts
+                self.sort_by(column)
+            elif self.scroll + row - 1 < len(self.order):
+                self.selected = self.scroll + row - 1
+
+    def draw(self, surface):
+        """
+        Draw the header and the visible window of rows.
+        Args:
+            surface (pygame.Surface): The surface to draw on.
+        """
+        for column, header in enumerate(self._header_surfaces):
+            surface.blit(header, (self.rect.x + column * self.column_width, self.rect.y))
+        arrow_x = self.rect.x + (self.sort_column + 1) * self.column_width - 20
+        surface.blit(self._arrow_surfaces[self.sort_descending], (arrow_x, self.rect.y))
+
+        now = pygame.time.get_ticks()
+        start, stop = self.visible_range()
+        visible_cache = {}
+        y = self.rect.y + self.row_height
+        for position in range(start, stop):
+            row = int(self.order[position])
+            row_rect = pygame.Rect(self.rect.x, y - 4, self.rect.width, self.row_height)
+            if position == self.selected:
+                surface.fill(self.selected_color, row_rect)
+            elif now - self.changed_at[row] < self.highlight_ms:
+                surface.fill(self.highlight_color, row_rect)
+
+            cells = self._row_cache.get(row)
+            if cells is None:
+                cells = self._render_row(row)
+            visible_cache[row] = cells
+            for column, cell in enumerate(cells):
+                surface.blit(cell, (self.rect.x + column * self.column_width, y))
+            y += self.row_height
+        self._row_cache = visible_cache
+
+        self._draw_scrollbar(surface)
+
+    def _render_row(self, row):
+        """
+        Render the cells of a single data row to text surfaces.
+        """
+        cells = []
+        for column, value in enumerate(self.values[row]):
+            text = f"{value:g}" if column == 0 else f"{value:.2f}"
+            cells.append(self.font.render(text, True, self.text_color))
+        return cells
+
+    def _draw_scrollbar(self, surface):
+        """
+        Draw a scrollbar on the right edge when not all rows fit on screen.
+        """
+        total = len(self.order)
+        if total <= self.visible_rows:
+            return
+        track_top = self.rect.y + self.row_height
+        track_height = self.visible_rows * self.row_height
+        thumb_height = max(10, track_height * self.visible_rows // total)
+        thumb_top = track_top + (track_height - thumb_height) * self.scroll // (total - self.visible_rows)
+        pygame.draw.rect(surface, self.header_color, (self.rect.right - 6, thumb_top, 4, thumb_height))
+
+    def _sort(self):
+        """
+        Recompute the display order from the current sort column and direction.
+        """
+        order = np.argsort(self.values[:, self.sort_column], kind="stable")
+        self.order = order[::-1] if self.sort_descending else order
+
+    def _clamp(self):
+        """
+        Keep the scroll offset and selection within the bounds of the data.
+        """
+        total = len(self.order)
+        self.scroll = max(0, min(self.scroll, total - self.visible_rows))
+        self.selected = max(0, min(self.selected, total - 1))
+
+    def _scroll_to_selected(self):
+        """
+        Scroll just enough to bring the selected row into view.
+        """
+        if self.selected < self.scroll:
+            self.scroll = self.selected
+        elif self.selected >= self.scroll + self.visible_rows:
+            self.scroll = self.selected - self.visible_rows + 1
+        self._clamp()
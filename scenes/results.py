@@ -1,17 +1,21 @@
 import pygame
 from scenes.base_scene import BaseScene
+from utils.resources import resources
 
 class ResultsScene(BaseScene):
     """
     Results scene for the Market Making Game.
-    Displays the final results, including the player's total P&L and performance summary.
+    Displays the final results, including the player's total P&L and performance summary
+    (from an optional session report produced by core.analytics.session_report).
     """
 
-    def __init__(self, screen, clock, player):
+    def __init__(self, screen, clock, player, report=None):
         super().__init__(screen, clock)
         self.player = player
-        self.font_title = pygame.font.Font(None, 48)
-        self.font_content = pygame.font.Font(None, 36)
+        self.report = report
+        self.font_title = resources.font(48)
+        self.font_content = resources.font(36)
+        self.font_report = resources.font(28)
         self.background_color = (0, 0, 0)  # Black background
         self.text_color = (255, 255, 255)  # White text
         self.secondary_text_color = (200, 200, 200)  # Light gray text
@@ -25,9 +29,7 @@ class ResultsScene(BaseScene):
                 if event.key == pygame.K_r:  # Restart the game
                     self.stop()  # Transition to the main menu or gameplay
                 elif event.key == pygame.K_q:  # Quit the game
-                    self.running = False
-                    pygame.quit()
-                    exit()
+                    self.quit_game()
 
     def update(self):
         """
@@ -43,7 +45,7 @@ class ResultsScene(BaseScene):
         self.screen.fill(self.background_color)
 
         # Display title
-        title_text = self.font_title.render("Game Over", True, self.text_color)
+        title_text = resources.text("Game Over", 48, self.text_color)
         title_rect = title_text.get_rect(center=(self.screen.get_width() // 2, 100))
         self.screen.blit(title_text, title_rect)
 
@@ -53,10 +55,40 @@ class ResultsScene(BaseScene):
         pnl_rect = pnl_text.get_rect(center=(self.screen.get_width() // 2, 200))
         self.screen.blit(pnl_text, pnl_rect)
 
+        # Display the session report
+        y_offset = 250
+        for line in self.report_lines():
+            line_text = self.font_report.render(line, True, self.secondary_text_color)
+            self.screen.blit(line_text, line_text.get_rect(center=(self.screen.get_width() // 2, y_offset)))
+            y_offset += 30
+
         # Display instructions
-        restart_text = self.font_content.render("Press R to Restart", True, self.secondary_text_color)
-        quit_text = self.font_content.render("Press Q to Quit", True, self.secondary_text_color)
-        restart_rect = restart_text.get_rect(center=(self.screen.get_width() // 2, 300))
-        quit_rect = quit_text.get_rect(center=(self.screen.get_width() // 2, 350))
+        restart_text = resources.text("Press R to Restart", 36, self.secondary_text_color)
+        quit_text = resources.text("Press Q to Quit", 36, self.secondary_text_color)
+        restart_rect = restart_text.get_rect(center=(self.screen.get_width() // 2, 480))
+        quit_rect = quit_text.get_rect(center=(self.screen.get_width() // 2, 530))
         self.screen.blit(restart_text, restart_rect)
         self.screen.blit(quit_text, quit_rect)
+
+    def report_lines(self):
+        """
+        Format the session report as lines of text (empty if there is no report).
+        """
+        if not self.report:
+            return []
+
+        def fmt(value, spec=".2f"):
+            return "-" if value != value else format(value, spec)  # NaN means not enough data
+
+        report = self.report
+        lines = [
+            f"Sharpe (per round): {fmt(report['sharpe'])}   Max Drawdown: ${fmt(report['max_drawdown'])}",
+            f"Orders: {report['orders']}   Fill Ratio: {fmt(report['fill_ratio'], '.0%')}   "
+            f"Turnover: {fmt(report['inventory_turnover'])}",
+            f"Mean Fill Latency: {fmt(report['mean_fill_latency_ms'])} ms",
+        ]
+        if report["pnl_by_strike"]:
+            # Show the strikes that contributed the most, in either direction
+            top = sorted(report["pnl_by_strike"].items(), key=lambda item: -abs(item[1]))[:3]
+            lines.append("Top Strikes: " + ", ".join(f"{strike:g}: {pnl:+.2f}" for strike, pnl in top))
+        return lines
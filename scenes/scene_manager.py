@@ -0,0 +1,148 @@
+import pygame
+
+
+class SceneManager:
+    """
+    Owns the game's single main loop and a stack of scenes.
+    The top scene receives input; overlay scenes are drawn over the scenes beneath them.
+    When nothing on screen changes, the loop stops redrawing and blocks until the next event.
+    """
+
+    def __init__(self, screen, clock, fps=60):
+        """
+        Initialize the SceneManager.
+        Args:
+            screen (pygame.Surface): The Pygame screen scenes are drawn on.
+            clock (pygame.time.Clock): The clock object to control the frame rate.
+            fps (int): Frame rate cap while scenes are updating or animating.
+        """
+        self.screen = screen
+        self.clock = clock
+        self.fps = fps
+        self.stack = []
+        self.running = False
+        self._was_animating = False
+
+    @property
+    def current_scene(self):
+        """
+        The scene at the top of the stack, or None if the stack is empty.
+        """
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        """
+        Push a scene onto the stack, making it the active scene.
+        Args:
+            scene (BaseScene): The scene to activate.
+        """
+        scene.manager = self
+        scene.on_enter()
+        self.stack.append(scene)
+
+    def pop(self):
+        """
+        Remove and return the active scene, revealing the one beneath it.
+        """
+        scene = self.stack.pop()
+        if self.stack:
+            self.stack[-1].mark_dirty()
+        return scene
+
+    def replace(self, scene):
+        """
+        Replace the active scene with another.
+        Args:
+            scene (BaseScene): The scene to activate.
+        """
+        if self.stack:
+            self.stack.pop()
+        self.push(scene)
+
+    def quit(self):
+        """
+        End the main loop after the current frame.
+        """
+        self.running = False
+
+    def visible_scenes(self):
+        """
+        Return the scenes that are drawn this frame, bottom first: the topmost
+        non-overlay scene and every overlay above it.
+        """
+        for index in range(len(self.stack) - 1, -1, -1):
+            if not self.stack[index].overlay:
+                return self.stack[index:]
+        return list(self.stack)
+
+    def run(self, flow):
+        """
+        Run the main loop until a scene quits or the flow is exhausted.
+        Args:
+            flow (iterable): Yields the next root scene each time the stack empties
+                (e.g., main menu, gameplay, results, main menu, ...).
+        """
+        flow = iter(flow)
+        self.running = True
+        while self.running:
+            if not self.stack:
+                scene = next(flow, None)
+                if scene is None:
+                    break
+                self.push(scene)
+
+            events = self._get_events()
+            if any(event.type == pygame.QUIT for event in events):
+                self.quit()
+                break
+
+            # Only the top scene gets input, but scenes under an overlay keep updating
+            scene = self.current_scene
+            scene.handle_events(events)
+            if events:
+                scene.mark_dirty()
+            for visible in self.visible_scenes():
+                visible.update()
+
+            # Drop any scenes that stopped during this frame
+            if any(not s.running for s in self.stack):
+                self.stack = [s for s in self.stack if s.running]
+                if self.stack:
+                    self.stack[-1].mark_dirty()
+                continue
+
+            self._draw()
+            self.clock.tick(self.fps)
+
+    def _is_idle(self):
+        """
+        Return True when no visible scene needs to be redrawn.
+        """
+        return not self._was_animating and not any(
+            scene.dirty or scene.is_animating() for scene in self.visible_scenes()
+        )
+
+    def _get_events(self):
+        """
+        Collect pending events, blocking until one arrives if the screen is idle.
+        """
+        if self._is_idle():
+            return [pygame.event.wait()] + pygame.event.get()
+        return pygame.event.get()
+
+    def _draw(self):
+        """
+        Redraw the visible scenes, bottom first, if any of them changed.
+        """
+        visible = self.visible_scenes()
+        animating = any(scene.is_animating() for scene in visible)
+        if not (animating or self._was_animating or any(scene.dirty for scene in visible)):
+            return
+
+        for scene in visible:
+            scene.draw()
+            scene.dirty = False
+        pygame.display.flip()
+
+        # One more frame after an animation ends clears its last state from the screen
+        self._was_animating = animating
@@ -0,0 +1,157 @@
+import time
+import pygame
+from scenes.base_scene import BaseScene
+from utils.resources import resources
+
+
+class TradeTicketScene(BaseScene):
+    """
+    Order-entry panel drawn over the gameplay scene.
+    Orders are validated and queued on the round manager; the gameplay scene fills them
+    on its next update, so entering an order never blocks the render loop.
+    """
+
+    overlay = True
+    FIELDS = ["strike", "type", "side", "quantity", "price"]
+    TEXT_FIELDS = {"strike": "0123456789", "quantity": "0123456789", "price": "0123456789."}
+
+    def __init__(self, screen, clock, market, round_manager, strike, option_type="call"):
+        """
+        Initialize the trade ticket.
+        Args:
+            market (Market): The market, used to look up bid/ask quotes.
+            round_manager (RoundManager): Receives the submitted orders.
+            strike (int): Strike the ticket opens on (e.g., the selected chain row).
+            option_type (str): 'call' or 'put'.
+        """
+        super().__init__(screen, clock)
+        self.market = market
+        self.round_manager = round_manager
+        self.font = resources.font(28)
+        self.panel = pygame.Rect(150, 130, 500, 320)
+        self.panel_color = (30, 30, 30)  # Dark gray panel
+        self.border_color = (200, 200, 200)  # Light gray border
+        self.text_color = (255, 255, 255)  # White text
+        self.active_color = (255, 180, 0)  # Amber for the active field
+        self.error_color = (255, 90, 90)  # Red for rejected orders
+
+        # Ticket fields, all edited as text
+        self.values = {"strike": str(strike), "type": option_type, "side": "buy", "quantity": "1", "price": ""}
+        self.active = 0
+        self.status = ""
+        self.status_color = self.text_color
+        self.fill_price_from_quote()
+
+    def quote(self):
+        """
+        Return the (bid, ask) for the ticket's strike and type, or None if the strike is not listed.
+        """
+        chain = self.market.option_chain
+        try:
+            row = chain.loc[chain["Strike Price"] == int(self.values["strike"])].iloc[0]
+        except (ValueError, IndexError):
+            return None
+        prefix = "Call" if self.values["type"] == "call" else "Put"
+        return row[f"{prefix} Bid Price"], row[f"{prefix} Ask Price"]
+
+    def fill_price_from_quote(self):
+        """
+        Default the price to the ask when buying and the bid when selling.
+        """
+        quote = self.quote()
+        if quote:
+            self.values["price"] = f"{quote[1] if self.values['side'] == 'buy' else quote[0]:.2f}"
+
+    def submit(self, side, price, submitted_at):
+        """
+        Validate and queue an order from the ticket's current fields.
+        Args:
+            side (str): 'buy' or 'sell'.
+            price (str): Price as entered.
+            submitted_at (float): time.perf_counter() value of the keystroke that sent the order.
+        """
+        try:
+            quantity = int(self.values["quantity"])
+            if side == "sell":
+                quantity = -quantity
+            self.round_manager.submit_order(
+                int(self.values["strike"]), self.values["type"], quantity, float(price), submitted_at
+            )
+        except ValueError as error:
+            self.status = f"Rejected: {error}"
+            self.status_color = self.error_color
+            return
+        self.status = f"Sent: {side} {abs(quantity)} {self.values['type']} {self.values['strike']} @ {float(price):.2f}"
+        self.status_color = self.text_color
+
+    def handle_events(self, events):
+        """
+        Handle field editing and order submission.
+        TAB/arrows move between fields, ENTER sends the ticket, B hits the bid,
+        A lifts the ask, C/P switch between calls and puts, ESC closes the ticket.
+        """
+        for event in events:
+            if event.type != pygame.KEYDOWN:
+                continue
+            submitted_at = time.perf_counter()
+            field = self.FIELDS[self.active]
+
+            if event.key == pygame.K_ESCAPE:
+                self.stop()
+            elif event.key in (pygame.K_TAB, pygame.K_DOWN, pygame.K_UP):
+                step = -1 if event.key == pygame.K_UP or event.mod & pygame.KMOD_SHIFT else 1
+                self.active = (self.active + step) % len(self.FIELDS)
+            elif event.key == pygame.K_RETURN:
+                self.submit(self.values["side"], self.values["price"], submitted_at)
+            elif event.key in (pygame.K_b, pygame.K_a):  # Hit the bid / lift the ask
+                quote = self.quote()
+                if quote is None:
+                    self.status = f"Rejected: Unknown strike: {self.values['strike']}"
+                    self.status_color = self.error_color
+                elif event.key == pygame.K_b:
+                    self.submit("sell", quote[0], submitted_at)
+                else:
+                    self.submit("buy", quote[1], submitted_at)
+            elif event.key in (pygame.K_c, pygame.K_p):
+                self.values["type"] = "call" if event.key == pygame.K_c else "put"
+                self.fill_price_from_quote()
+            elif field in ("type", "side") and event.key in (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_SPACE):
+                options = ("call", "put") if field == "type" else ("buy", "sell")
+                self.values[field] = options[1] if self.values[field] == options[0] else options[0]
+                self.fill_price_from_quote()
+            elif field in self.TEXT_FIELDS:
+                if event.key == pygame.K_BACKSPACE:
+                    self.values[field] = self.values[field][:-1]
+                elif event.unicode and event.unicode in self.TEXT_FIELDS[field]:
+                    self.values[field] += event.unicode
+                if field == "strike":
+                    self.fill_price_from_quote()
+
+    def update(self):
+        """
+        Nothing to update; orders are filled by the gameplay scene underneath.
+        """
+        pass
+
+    def draw(self):
+        """
+        Draw the ticket panel over the scene beneath it.
+        """
+        pygame.draw.rect(self.screen, self.panel_color, self.panel)
+        pygame.draw.rect(self.screen, self.border_color, self.panel, 2)
+        self.screen.blit(resources.text("Trade Ticket", 36, self.text_color), (self.panel.x + 20, self.panel.y + 15))
+
+        y = self.panel.y + 60
+        for index, field in enumerate(self.FIELDS):
+            color = self.active_color if index == self.active else self.text_color
+            label = self.font.render(f"{field.capitalize()}: {self.values[field]}", True, color)
+            self.screen.blit(label, (self.panel.x + 20, y))
+            y += 30
+
+        quote = self.quote()
+        quote_line = "Bid: -  Ask: -" if quote is None else f"Bid: {quote[0]:.2f}  Ask: {quote[1]:.2f}"
+        self.screen.blit(self.font.render(quote_line, True, self.text_color), (self.panel.x + 260, self.panel.y + 60))
+
+        self.screen.blit(self.font.render(self.status, True, self.status_color), (self.panel.x + 20, y + 10))
+        help_text = resources.text("TAB field  ENTER send  B hit bid  A lift ask  ESC close", 24, self.border_color)
+        self.screen.blit(help_text, (self.panel.x + 20, self.panel.bottom - 30))
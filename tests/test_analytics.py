@@ -0,0 +1,102 @@
+import contextlib
+import io
+import tempfile
+import unittest
+import numpy as np
+from core.analytics import SessionRecorder, load_session, session_report, cohort_report, sharpe_ratio, max_drawdown
+from core.market import Market
+from core.player import Player
+from core.round_manager import RoundManager
+
+
+class TestMetrics(unittest.TestCase):
+    def test_max_drawdown(self):
+        """
+        Test that drawdown is measured from the running peak.
+        """
+        self.assertEqual(max_drawdown(np.array([0.0, 5.0, 2.0, 8.0, 1.0, 3.0])), 7.0)
+        self.assertEqual(max_drawdown(np.array([1.0, 2.0, 3.0])), 0.0)
+        self.assertEqual(max_drawdown(np.array([])), 0.0)
+
+    def test_sharpe_ratio(self):
+        """
+        Test the per-round Sharpe ratio and its undefined cases.
+        """
+        pnl = np.array([0.0, 1.0, 3.0, 4.0])  # Changes: 1, 2, 1
+        changes = np.diff(pnl)
+        self.assertAlmostEqual(sharpe_ratio(pnl), changes.mean() / changes.std(ddof=1))
+        self.assertTrue(np.isnan(sharpe_ratio(np.array([0.0, 1.0]))), "One change is not enough")
+        self.assertTrue(np.isnan(sharpe_ratio(np.array([0.0, 1.0, 2.0]))), "Constant changes have no deviation")
+
+
+class TestSessionRecording(unittest.TestCase):
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def play_session(self, session_id):
+        """
+        Play a short session with one rejected and two filled orders, recorded under the temp root.
+        """
+        market = Market(initial_price=100.0, volatility=0.30, strikes=[90, 100, 110])
+        player = Player()
+        recorder = SessionRecorder(self.root.name, session_id)
+        round_manager = RoundManager(market, player, recorder=recorder)
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            round_manager.submit_order(100, "call", 2, 5.0)
+            with self.assertRaises(ValueError):
+                round_manager.submit_order(95, "call", 1, 5.0)
+            round_manager.process_player_input()
+            round_manager.simulate_round()
+            round_manager.submit_order(110, "put", -1, 12.0)
+            round_manager.process_player_input()
+            round_manager.simulate_round()
+            round_manager.end_session()
+        return recorder, player, market
+
+    def test_session_is_streamed_per_round(self):
+        """
+        Test that every round, chain snapshot and order is written to the column files.
+        """
+        recorder, player, market = self.play_session("a")
+        tables = load_session(recorder.path)
+
+        self.assertEqual(tables["rounds"]["round"].tolist(), [0, 1, 2])
+        self.assertEqual(len(tables["chain"]["strike"]), 3 * len(market.strikes))
+        self.assertEqual(tables["orders"]["filled"].tolist(), [0, 1, 1])  # Rejections are recorded on submit
+        self.assertEqual(tables["orders"]["round"].tolist(), [1, 1, 2])  # Round 0 is the opening snapshot
+        self.assertAlmostEqual(tables["rounds"]["pnl"][-1], player.get_total_pnl(market))
+
+    def test_session_report(self):
+        """
+        Test the report metrics, including that P&L attribution adds up to the final P&L.
+        """
+        recorder, player, market = self.play_session("a")
+        report = session_report(recorder.path)
+
+        self.assertEqual(report["rounds"], 3)
+        self.assertEqual(report["orders"], 3)
+        self.assertAlmostEqual(report["fill_ratio"], 2 / 3)
+        self.assertEqual(sorted(report["pnl_by_strike"]), [100.0, 110.0])
+        self.assertAlmostEqual(sum(report["pnl_by_strike"].values()), player.get_total_pnl(market))
+        self.assertAlmostEqual(player.total_pnl, player.get_total_pnl(market), msg="Player total P&L should be kept current")
+
+    def test_cohort_report(self):
+        """
+        Test that the cohort report has one row per session and totals attribution across sessions.
+        """
+        reports = []
+        for session_id in ("a", "b", "c"):
+            recorder, _, _ = self.play_session(session_id)
+            reports.append(session_report(recorder.path))
+
+        metrics, by_strike = cohort_report(self.root.name)
+        self.assertEqual(metrics["session"].tolist(), ["a", "b", "c"])
+        self.assertAlmostEqual(by_strike.sum(), sum(report["final_pnl"] for report in reports))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+from core.market import Market
+from core.history import RingBuffer, MarketHistory
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_values_in_order_before_full(self):
+        """
+        Test that values come back oldest first while the buffer has room.
+        """
+        buffer = RingBuffer(5)
+        for value in (1.0, 2.0, 3.0):
+            buffer.append(value)
+        self.assertEqual(len(buffer), 3)
+        self.assertEqual(buffer.values().tolist(), [1.0, 2.0, 3.0])
+        self.assertEqual(buffer.latest(), 3.0)
+
+    def test_overwrites_oldest_when_full(self):
+        """
+        Test that the buffer keeps only the most recent entries once it wraps.
+        """
+        buffer = RingBuffer(4)
+        for value in range(10):
+            buffer.append(value)
+        self.assertEqual(len(buffer), 4, "Buffer should never exceed its capacity")
+        self.assertEqual(buffer.values().tolist(), [6.0, 7.0, 8.0, 9.0])
+        self.assertEqual(buffer.latest(), 9.0)
+
+    def test_vector_entries(self):
+        """
+        Test that vector-valued buffers store one row per entry.
+        """
+        buffer = RingBuffer(2, width=3)
+        buffer.append([1, 2, 3])
+        buffer.append([4, 5, 6])
+        buffer.append([7, 8, 9])
+        self.assertEqual(buffer.values().tolist(), [[4, 5, 6], [7, 8, 9]])
+
+    def test_empty_buffer(self):
+        """
+        Test that an empty buffer has no values and no latest entry.
+        """
+        buffer = RingBuffer(3)
+        self.assertEqual(len(buffer.values()), 0)
+        self.assertIsNone(buffer.latest())
+
+
+class TestMarketHistory(unittest.TestCase):
+    def test_record_is_bounded(self):
+        """
+        Test that recording many rounds keeps memory bounded and tracks the latest state.
+        """
+        market = Market(initial_price=100.0, volatility=0.30, strikes=[90, 100, 110])
+        history = MarketHistory(market.strikes, capacity=8)
+        for round_pnl in range(20):
+            history.record(market, float(round_pnl))
+
+        self.assertEqual(len(history.price), 8)
+        self.assertEqual(history.pnl.values().tolist(), [float(pnl) for pnl in range(12, 20)])
+        self.assertEqual(history.iv_smile().tolist(), market.option_chain["Call IV"].tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
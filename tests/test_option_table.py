@@ -0,0 +1,95 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from core.market import Market
+from scenes.option_table import OptionChainTable
+
+
+class TestOptionChainTable(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        """
+        Set up a large market and a table showing 10 rows at a time.
+        """
+        self.market = Market(initial_price=100.0, volatility=0.30, strikes=list(range(1, 5001)))
+        self.table = OptionChainTable(pygame.Rect(0, 0, 760, 330), pygame.font.Font(None, 28))
+        self.table.set_data(self.market.option_chain)
+
+    def test_visible_window_is_bounded(self):
+        """
+        Test that only a screenful of rows is visible, however long the chain is.
+        """
+        start, stop = self.table.visible_range()
+        self.assertEqual(stop - start, 10, "Only the visible rows should be in the window")
+
+        surface = pygame.Surface((800, 600))
+        self.table.draw(surface)
+        self.assertEqual(len(self.table._row_cache), 10, "Only visible rows should be rendered")
+
+    def test_scroll_is_clamped(self):
+        """
+        Test that scrolling cannot move past either end of the chain.
+        """
+        self.table.scroll_by(-5)
+        self.assertEqual(self.table.visible_range(), (0, 10))
+        self.table.scroll_by(10000)
+        self.assertEqual(self.table.visible_range(), (4990, 5000))
+
+    def test_selection_scrolls_into_view(self):
+        """
+        Test that moving the selection keeps it inside the visible window.
+        """
+        self.table.select_by(25)
+        start, stop = self.table.visible_range()
+        self.assertTrue(start <= self.table.selected < stop, "Selected row should be visible")
+
+    def test_sort_by_column(self):
+        """
+        Test that sorting orders rows and toggles direction on repeated clicks.
+        """
+        self.table.sort_by(1)  # Call Bid ascending
+        bids = self.table.values[self.table.order, 1]
+        self.assertTrue((bids[:-1] <= bids[1:]).all(), "Rows should be sorted ascending")
+
+        self.table.sort_by(1)  # Call Bid descending
+        bids = self.table.values[self.table.order, 1]
+        self.assertTrue((bids[:-1] >= bids[1:]).all(), "Rows should be sorted descending")
+
+    def test_sort_keeps_selected_row(self):
+        """
+        Test that re-sorting keeps the same strike selected.
+        """
+        self.table.select_by(3)
+        selected = self.table.selected_row_index()
+        self.table.sort_by(0)  # Strike descending
+        self.assertEqual(self.table.selected_row_index(), selected)
+
+    def test_changed_rows_are_highlighted(self):
+        """
+        Test that rows whose quotes change are marked as changed.
+        """
+        table = OptionChainTable(pygame.Rect(0, 0, 760, 330), pygame.font.Font(None, 28), highlight_ms=60000)
+        table.set_data(self.market.option_chain)
+        self.assertFalse(table.is_animating(), "Nothing should be highlighted initially")
+
+        self.market.option_chain.loc[7, "Call Bid Price"] += 1.0
+        table.set_data(self.market.option_chain)
+
+        now = pygame.time.get_ticks()
+        changed = now - table.changed_at < table.highlight_ms
+        self.assertEqual(changed.nonzero()[0].tolist(), [7], "Only the modified row should be highlighted")
+        self.assertTrue(table.is_animating())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from utils.resources import ResourceManager
+
+
+class TestResourceManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        self.resources = ResourceManager()
+
+    def test_fonts_are_shared(self):
+        """
+        Test that requesting the same font twice returns the same object.
+        """
+        self.assertIs(self.resources.font(28), self.resources.font(28))
+        self.assertIsNot(self.resources.font(28), self.resources.font(36))
+
+    def test_static_text_is_rendered_once(self):
+        """
+        Test that static text is rendered once and then reused.
+        """
+        first = self.resources.text("Game Over", 48, (255, 255, 255))
+        self.assertIs(first, self.resources.text("Game Over", 48, (255, 255, 255)))
+        self.assertIsNot(first, self.resources.text("Game Over", 48, (200, 200, 200)))
+
+    def test_surface_builder_called_once(self):
+        """
+        Test that a cached surface is only built on the first request.
+        """
+        calls = []
+
+        def build():
+            calls.append(1)
+            return pygame.Surface((10, 10))
+
+        surface = self.resources.surface("menu", build)
+        self.assertIs(surface, self.resources.surface("menu", build))
+        self.assertEqual(len(calls), 1, "Builder should only run once")
+
+        self.resources.clear()
+        self.resources.surface("menu", build)
+        self.assertEqual(len(calls), 2, "Builder should run again after clearing the cache")
+
+
+if __name__ == "__main__":
+    unittest.main()
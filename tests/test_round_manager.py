@@ -0,0 +1,75 @@
+import contextlib
+import io
+import unittest
+from core.market import Market
+from core.player import Player
+from core.round_manager import RoundManager
+
+
+class TestRoundManagerOrders(unittest.TestCase):
+    def setUp(self):
+        """
+        Set up a small market and a round manager with an empty order queue.
+        """
+        self.market = Market(initial_price=100.0, volatility=0.30, strikes=[90, 100, 110])
+        self.player = Player()
+        self.round_manager = RoundManager(self.market, self.player)
+
+    def process(self):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return self.round_manager.process_player_input()
+
+    def test_submit_queues_without_filling(self):
+        """
+        Test that submitting an order only queues it.
+        """
+        self.round_manager.submit_order(100, "CALL", 2, 5.5)
+        self.assertEqual(len(self.round_manager.order_queue), 1)
+        self.assertEqual(self.player.inventory, {}, "Orders should not fill until processed")
+        self.assertEqual(self.round_manager.order_queue[0]["type"], "call")
+
+    def test_invalid_orders_are_rejected(self):
+        """
+        Test that invalid orders raise ValueError and are not queued.
+        """
+        invalid_orders = [
+            (95, "call", 1, 5.0),  # Strike not listed
+            (100, "straddle", 1, 5.0),  # Unknown option type
+            (100, "call", 0, 5.0),  # Zero quantity
+            (100, "call", 1.5, 5.0),  # Fractional quantity
+            (100, "put", 1, 0.0),  # Non-positive price
+            (100, "put", 1, float("nan")),  # Not a number
+        ]
+        for order in invalid_orders:
+            with self.assertRaises(ValueError, msg=f"Order should be rejected: {order}"):
+                self.round_manager.submit_order(*order)
+        self.assertEqual(len(self.round_manager.order_queue), 0)
+
+    def test_process_fills_queued_orders(self):
+        """
+        Test that processing fills every queued order in order and records latency.
+        """
+        self.round_manager.submit_order(100, "call", 2, 5.0)
+        self.round_manager.submit_order(110, "put", -1, 12.0)
+        fills = self.process()
+
+        self.assertEqual([fill["strike"] for fill in fills], [100, 110])
+        self.assertEqual(len(self.round_manager.order_queue), 0)
+        self.assertEqual(self.round_manager.trades, fills)
+        self.assertTrue(all(fill["latency"] >= 0 for fill in fills))
+        self.assertAlmostEqual(self.player.cash, -2 * 5.0 + 12.0)
+        self.assertEqual(self.process(), [], "Nothing should be filled twice")
+
+    def test_total_pnl_after_trade(self):
+        """
+        Test that open positions are marked to the option chain's last traded price.
+        """
+        self.round_manager.submit_order(100, "put", 3, 4.0)
+        self.process()
+
+        put_ltp = self.market.option_chain.loc[self.market.option_chain["Strike Price"] == 100, "Put LTP"].values[0]
+        self.assertAlmostEqual(self.player.get_total_pnl(self.market), -12.0 + 3 * put_ltp)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import os
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from scenes.base_scene import BaseScene
+from scenes.scene_manager import SceneManager
+
+
+class RecordingScene(BaseScene):
+    """
+    Scene that records calls and stops itself after a number of frames.
+    """
+
+    def __init__(self, screen, clock, frames=1, overlay=False):
+        super().__init__(screen, clock)
+        self.frames = frames
+        self.overlay = overlay
+        self.updates = 0
+        self.draws = 0
+
+    def handle_events(self, events):
+        pass
+
+    def is_animating(self):
+        return self.frames > 1
+
+    def update(self):
+        self.updates += 1
+        if self.updates >= self.frames:
+            self.stop()
+
+    def draw(self):
+        self.draws += 1
+
+
+class TestSceneManager(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.init()
+        cls.screen = pygame.display.set_mode((100, 100))
+
+    @classmethod
+    def tearDownClass(cls):
+        pygame.quit()
+
+    def setUp(self):
+        pygame.event.clear()
+        self.manager = SceneManager(self.screen, pygame.time.Clock(), fps=0)
+
+    def make_scene(self, **kwargs):
+        return RecordingScene(self.screen, self.manager.clock, **kwargs)
+
+    def test_push_and_pop(self):
+        """
+        Test that the stack tracks the active scene.
+        """
+        first, second = self.make_scene(), self.make_scene()
+        self.manager.push(first)
+        self.manager.push(second)
+        self.assertIs(self.manager.current_scene, second)
+        self.assertIs(second.manager, self.manager)
+
+        self.assertIs(self.manager.pop(), second)
+        self.assertIs(self.manager.current_scene, first)
+        self.assertTrue(first.dirty, "Revealed scene should be redrawn")
+
+    def test_overlay_draws_over_scene_beneath(self):
+        """
+        Test that overlays are drawn together with the scene under them.
+        """
+        base, hidden = self.make_scene(), self.make_scene()
+        overlay = self.make_scene(overlay=True)
+        self.manager.push(hidden)
+        self.manager.push(base)
+        self.manager.push(overlay)
+        self.assertEqual(self.manager.visible_scenes(), [base, overlay])
+
+    def test_flow_runs_scenes_in_order(self):
+        """
+        Test that the main loop runs each scene from the flow until it stops.
+        """
+        scenes = [self.make_scene(frames=3), self.make_scene(frames=2)]
+        self.manager.run(scenes)
+        self.assertEqual([scene.updates for scene in scenes], [3, 2])
+        self.assertEqual(self.manager.stack, [])
+
+    def test_quit_event_ends_loop(self):
+        """
+        Test that a window close event stops the main loop.
+        """
+        scene = self.make_scene(frames=1000)
+        pygame.event.post(pygame.event.Event(pygame.QUIT))
+        self.manager.run([scene])
+        self.assertFalse(self.manager.running)
+        self.assertEqual(scene.updates, 0)
+
+    def test_idle_scene_is_not_redrawn(self):
+        """
+        Test that a static scene is drawn once and then left alone until something changes.
+        """
+        scene = self.make_scene(frames=1)
+        self.manager.push(scene)
+        self.manager._draw()
+        self.manager._draw()
+        self.assertEqual(scene.draws, 1, "Static scene should not be redrawn")
+        self.assertTrue(self.manager._is_idle())
+
+        scene.mark_dirty()
+        self.manager._draw()
+        self.assertEqual(scene.draws, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import pygame
+
+
+class ResourceManager:
+    """
+    Loads fonts and prerendered static surfaces once and shares them across scenes.
+    Everything is created lazily on first use, so nothing is loaded before it is needed.
+    """
+
+    def __init__(self):
+        self._fonts = {}
+        self._texts = {}
+        self._surfaces = {}
+
+    def font(self, size, name=None):
+        """
+        Return a cached font.
+        Args:
+            size (int): Font size.
+            name (str): Path to a font file, or None for the default Pygame font.
+        """
+        key = (name, size)
+        if key not in self._fonts:
+            self._fonts[key] = pygame.font.Font(name, size)
+        return self._fonts[key]
+
+    def text(self, text, size, color):
+        """
+        Return a cached rendering of static text in the default font.
+        Args:
+            text (str): The text to render.
+            size (int): Font size.
+            color (tuple): RGB text color.
+        """
+        key = (text, size, color)
+        if key not in self._texts:
+            self._texts[key] = self.font(size).render(text, True, color)
+        return self._texts[key]
+
+    def surface(self, key, build):
+        """
+        Return a cached surface, building it on first request.
+        Args:
+            key (hashable): Name identifying the surface.
+            build (callable): Function that returns the surface when it is not cached yet.
+        """
+        if key not in self._surfaces:
+            self._surfaces[key] = build()
+        return self._surfaces[key]
+
+    def clear(self):
+        """
+        Drop all cached resources (e.g., after pygame.quit()).
+        """
+        self._fonts.clear()
+        self._texts.clear()
+        self._surfaces.clear()
+
+
+# Shared instance used by all scenes
+resources = ResourceManager()